@@ -7,9 +7,123 @@ Author: [Dane Alexander Hincapie Arango/Grupo: Innovación en Matemáticas y Nue
 License: MIT / Academic Use
 """
 
+import functools
+import hashlib
+import os
+import warnings
+from types import SimpleNamespace
+
 import numpy as np
-import pandas as pd
-from typing import List, Tuple, Dict, Union, Optional
+from typing import List, Tuple, Dict, Union, Optional, Sequence
+
+try:
+    from joblib import Parallel, delayed, effective_n_jobs
+except ImportError:  # optional, only needed for parallel partition sweeps
+    Parallel = None
+
+# Process-wide memo of the h_k basis, keyed by (prime set digest, max_degree).
+_H_BASIS_CACHE: Dict[Tuple[bytes, int], np.ndarray] = {}
+# Power sums p_1..p_M keyed by prime set digest; extended when M grows.
+_P_SUMS_CACHE: Dict[bytes, np.ndarray] = {}
+
+# Maximum number of memoized partition determinants per sieve (oldest evicted first)
+_PARTITION_CACHE_SIZE = 4096
+
+# Below this size a Python loop builds Jacobi-Trudi matrices faster than the NumPy gather
+_GATHER_MIN_K = 8
+
+# Largest condition number accepted for a matrix whose determinant is reported
+_COND_LIMIT = 1e12
+
+# Moves between full refactorizations in walk_partition(), bounding Sherman-Morrison drift
+_WALK_REFACTOR = 8
+# Largest residual |M inv[:, i] - e_i| accepted after a rank-1 update of the inverse
+_WALK_RESIDUAL = 1e-10
+
+# Values parsed per read when streaming a prime file
+_LOAD_CHUNK = 1 << 20
+
+# Below this degree the NumPy recurrence is cheaper than dispatching to the JIT kernel
+_NJIT_MIN_DEGREE = 50
+# Below this many primes the NumPy power sums are cheaper than the JIT kernel
+_NJIT_MIN_PRIMES = 1_000_000
+# Below this many primes the NumPy branching-rule loop is cheaper than loading the JIT kernel
+_NJIT_MIN_KOEV_PRIMES = 20_000
+# Primes per partial sum in the fused power-sum kernel (NumPy's pairwise leaf size)
+_POWER_SUM_BLOCK = 128
+
+@functools.lru_cache(maxsize=None)
+def _jit_kernels() -> Optional[SimpleNamespace]:
+    """
+    Imports numba and defines the JIT kernels on first use, so that importing
+    this module stays cheap for workloads below the JIT thresholds.
+    Returns None when numba is not installed (the NumPy paths are used instead).
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # optional, JIT kernels for large bases and prime sets
+        return None
+
+    @njit(cache=True)
+    def newton_h(p_sums: np.ndarray, h: np.ndarray, start: int) -> None:
+        """
+        Continues n * h_n = sum_{k=1}^n (p_k * h_{n-k}) in place for n > start.
+        Numba has no long double, so the float64 sums are compensated (Neumaier).
+        """
+        for n in range(start + 1, h.shape[0]):
+            s = 0.0
+            c = 0.0
+            for k in range(1, n + 1):
+                term = p_sums[k - 1] * h[n - k]
+                t = s + term
+                if abs(s) >= abs(term):
+                    c += (s - t) + term
+                else:
+                    c += (term - t) + s
+                s = t
+            h[n] = (s + c) / n
+
+    @njit(parallel=True, cache=True)
+    def accumulate_power_sums(betas: np.ndarray, cur: np.ndarray, n_terms: int) -> np.ndarray:
+        """
+        Advances every cur[i] = beta_i^start through n_terms further powers and
+        returns the per-block partial sums of each power, shape (n_terms, n_blocks).
+        The primes are streamed once instead of once per degree.
+        """
+        n = betas.shape[0]
+        n_blocks = (n + _POWER_SUM_BLOCK - 1) // _POWER_SUM_BLOCK
+        partial = np.zeros((n_terms, n_blocks))
+        for b in prange(n_blocks):
+            for i in range(b * _POWER_SUM_BLOCK, min(n, (b + 1) * _POWER_SUM_BLOCK)):
+                x = betas[i]
+                c = cur[i]
+                for k in range(n_terms):
+                    c *= x
+                    partial[k, b] += c
+                cur[i] = c
+        return partial
+
+    @njit(cache=True)
+    def strip_transfer(betas: np.ndarray, src: np.ndarray, dst: np.ndarray, deg: np.ndarray,
+                       state: np.ndarray, max_deg: int) -> np.ndarray:
+        """
+        Applies one branching-rule transfer step per beta: every state nu gathers
+        state[rho] * x^{|nu/rho|} over the strip transitions (src, dst, deg).
+        """
+        x_pow = np.empty(max_deg + 1)
+        nxt = np.empty_like(state)
+        for x in betas:
+            x_pow[0] = 1.0
+            for d in range(1, max_deg + 1):
+                x_pow[d] = x_pow[d - 1] * x
+            nxt[:] = 0.0
+            for t in range(src.shape[0]):
+                nxt[dst[t]] += state[src[t]] * x_pow[deg[t]]
+            state, nxt = nxt, state
+        return state
+
+    return SimpleNamespace(newton_h=newton_h, accumulate_power_sums=accumulate_power_sums,
+                           strip_transfer=strip_transfer)
 
 class SchurSieve:
     """
@@ -28,20 +142,57 @@ class SchurSieve:
         :param n_limit: The cardinality N of the prime set to be processed.
         :raises FileNotFoundError: If the data source is inaccessible.
         """
+        # Kept as int64; betas = 1/p are derived on demand in compute_basis()
         self._primes: np.ndarray = self._load_data(data_source, n_limit)
+        # Hashed through the buffer protocol, without a tobytes() copy
+        self._digest: bytes = hashlib.blake2b(self._primes, digest_size=16).digest()
         self._h_basis: np.ndarray = np.array([]) 
+        # float64 copy of the basis shifted by one, with h_padded[0] = 0 for h_{k<0}
+        self._h_padded: np.ndarray = np.zeros(1)
+        self._h_list: List[float] = [0.0]  # same, for the scalar path of small matrices
         self._degree: int = 0
+        # Incremental state: p_sums[k] = p_{k+1}, _cur_power = betas^len(p_sums)
+        self._p_sums: np.ndarray = np.array([])
+        self._cur_power: Optional[np.ndarray] = None
+        # Optional table _beta_pow[k, i] = (1/p_i)^(k+1), see reciprocal_powers()
+        self._beta_pow: np.ndarray = np.empty((0, 0))
+        # (sign, log|det|) per normalized (lambda, mu) tuples, valid for the current basis only;
+        # bounded by _PARTITION_CACHE_SIZE, see _memoize_partition()
+        self._partition_cache: Dict[Tuple[Tuple[int, ...], Tuple[int, ...]], Tuple[float, float]] = {}
         
     def _load_data(self, path: str, limit: int) -> np.ndarray:
         """
         Ingests raw prime data. 
-        Uses Pandas C-engine for high-performance parsing of large datasets (N > 10^7).
+        Uses NumPy's C text scanner (np.fromfile) for high-performance parsing of
+        large datasets (N > 10^7), without building an intermediate DataFrame.
+        The file is streamed in chunks of _LOAD_CHUNK values into a single buffer,
+        so peak memory is the result plus one chunk, and the buffer is bounded by
+        the file size rather than by limit.
         Expects a flat text file (newline or space separated) without headers.
         """
         try:
-            # Assumes whitespace-separated values or single column CSV
-            df = pd.read_csv(path, nrows=limit, header=None, sep=r'\s+')
-            return df[0].values.astype(np.float64)
+            # Each value takes at least two bytes (a digit and a separator)
+            capacity = min(limit, os.path.getsize(path) // 2 + 1)
+            try:
+                # Assumes whitespace-separated values; older NumPy versions
+                # only warn on unmatched data, so promote that to an error.
+                with warnings.catch_warnings(), open(path, 'rb') as fh:
+                    warnings.simplefilter("error", DeprecationWarning)
+                    arr = np.empty(capacity, dtype=np.int64)
+                    filled = 0
+                    while filled < capacity:
+                        chunk = np.fromfile(fh, sep=' ', dtype=np.int64,
+                                            count=min(_LOAD_CHUNK, capacity - filled))
+                        if not len(chunk):
+                            break
+                        arr[filled:filled + len(chunk)] = chunk
+                        filled += len(chunk)
+                    arr.resize(filled, refcheck=False)
+            except (ValueError, DeprecationWarning):
+                # Single column CSV
+                arr = np.loadtxt(path, delimiter=',', usecols=0, max_rows=capacity,
+                                 dtype=np.int64, ndmin=1)
+            return arr
         except Exception as e:
             raise IOError(f"Data ingestion failure: {e}")
 
@@ -52,55 +203,215 @@ class SchurSieve:
         
         Let p_k = sum(1/p_i^k). The basis {h_k} is generated recursively:
         n * h_n = sum_{k=1}^n (p_k * h_{n-k}).
+        Both p_k and h_k are accumulated in np.longdouble. When numba is installed,
+        h_k for k >= _NJIT_MIN_DEGREE come from a compensated float64 kernel instead;
+        lower terms are always long double, so the basis does not depend on the
+        order of calls.
+        
+        Repeated calls are incremental: a basis of lower degree is extended
+        from its last term, and a request within the current degree is a no-op.
         
         :param max_degree: The maximum weight of the partitions to be evaluated.
         """
         if max_degree <= 0:
             raise ValueError("Degree must be a positive integer.")
-            
-        # Precompute power sums p_k for k in [1, max_degree]
-        # Inversion of primes: betas = 1/p
-        betas = np.reciprocal(self._primes)
-        
-        # p_sums[k] corresponds to p_{k+1}
-        p_sums = [np.sum(np.power(betas, k)) for k in range(1, max_degree + 1)]
-        
-        h = [1.0] # h_0 = 1
-        
-        for n in range(1, max_degree + 1):
+        if max_degree <= self._degree:
+            return
+
+        key = (self._digest, max_degree)
+        cached = _H_BASIS_CACHE.get(key)
+        if cached is not None:
+            self._set_basis(cached, max_degree)
+            return
+
+        p_sums = self._power_sums(max_degree)
+
+        # Continue the recurrence from the current degree
+        start = self._degree
+        h = np.empty(max_degree + 1, dtype=np.longdouble)
+        h[0] = 1.0 # h_0 = 1
+        h[1:start + 1] = self._h_basis[1:start + 1]
+
+        jit = _jit_kernels() if max_degree >= _NJIT_MIN_DEGREE else None
+        # Last degree of the long double recurrence; the kernel continues from there
+        split = max_degree if jit is None else max(start, _NJIT_MIN_DEGREE - 1)
+        for n in range(start + 1, split + 1):
             # Newton Identity application
-            # term: p_k * h_{n-k}
-            term_sum = sum(p_sums[k-1] * h[n-k] for k in range(1, n+1))
-            h.append(term_sum / n)
-            
-        self._h_basis = np.array(h)
+            # term: p_k * h_{n-k}, with h read in reverse order
+            h[n] = np.dot(p_sums[:n], h[n-1::-1]) / n
+        if jit is not None:
+            h_jit = np.empty(max_degree + 1, dtype=np.float64)
+            h_jit[:split + 1] = h[:split + 1]
+            jit.newton_h(p_sums.astype(np.float64), h_jit, split)
+            h[split + 1:] = h_jit[split + 1:]
+
+        h.flags.writeable = False # shared through _H_BASIS_CACHE
+        _H_BASIS_CACHE[key] = h
+        self._set_basis(h, max_degree)
+
+    def _set_basis(self, h: np.ndarray, max_degree: int) -> None:
+        """
+        Installs a new h_k basis, refreshing the float64 lookup table used to
+        build Jacobi-Trudi matrices and dropping memoized determinants.
+        """
+        self._h_basis = h
         self._degree = max_degree
+        self._h_padded = np.zeros(len(h) + 1, dtype=np.float64)
+        self._h_padded[1:] = h
+        self._h_list = self._h_padded.tolist()
+        self._partition_cache.clear()
 
-    def _construct_jacobi_trudi(self, lam: List[int], mu: List[int]) -> np.ndarray:
+    def _power_sums(self, max_degree: int) -> np.ndarray:
+        """
+        Returns the power sums p_k = sum(1/p_i^k) for k in [1, max_degree].
+        Sums already known for this prime set are reused; only the missing
+        tail of degrees is streamed over the primes.
+        """
+        known = _P_SUMS_CACHE.get(self._digest)
+        if known is not None and len(known) > len(self._p_sums):
+            self._p_sums = known
+            self._cur_power = None
+        start = len(self._p_sums)
+        if start >= max_degree:
+            return self._p_sums[:max_degree]
+
+        # p_sums[k] corresponds to p_{k+1}
+        p_sums = np.empty(max_degree, dtype=np.longdouble)
+        p_sums[:start] = self._p_sums
+
+        if len(self._beta_pow) >= max_degree:
+            # Powers already tabulated: one pairwise reduction per row
+            p_sums[start:] = self._beta_pow[start:max_degree].sum(axis=1, dtype=np.longdouble)
+            cur = None
+        elif len(self._primes) >= _NJIT_MIN_PRIMES and _jit_kernels() is not None:
+            # Fused multiply-and-sum over the primes (float64, Numba has no long double)
+            betas = np.reciprocal(self._primes.astype(np.float64))
+            if self._cur_power is None:
+                cur = np.power(betas, start)
+            else:
+                cur = self._cur_power.astype(np.float64, copy=False)
+            partial = _jit_kernels().accumulate_power_sums(betas, cur, max_degree - start)
+            # Contiguous rows: NumPy reduces the block sums pairwise
+            p_sums[start:] = partial.sum(axis=1, dtype=np.longdouble)
+        else:
+            # Inversion of primes: betas = 1/p, in extended precision so that the
+            # sums of ~N tiny terms and the recurrence keep their low-order bits
+            betas = np.reciprocal(self._primes.astype(np.longdouble))
+
+            # Powers are accumulated in a single reused buffer (cur = betas^(k+1))
+            if self._cur_power is None:
+                cur = np.power(betas, start + 1)
+            else:
+                cur = self._cur_power
+                cur *= betas
+            p_sums[start] = cur.sum()
+            for k in range(start + 1, max_degree):
+                cur *= betas
+                p_sums[k] = cur.sum()
+
+        self._p_sums = p_sums
+        self._cur_power = cur
+        _P_SUMS_CACHE[self._digest] = p_sums
+        return p_sums
+
+    def reciprocal_powers(self, max_degree: int) -> np.ndarray:
+        """
+        Returns the table T[k, i] = (1/p_i)^(k+1) for k in [0, max_degree), for
+        per-prime analyses. The table is built lazily, extended one row at a time
+        from the previous one, and reused by compute_basis() while it is large
+        enough. It holds max_degree * N floats, so the basis never builds it.
+        
+        :param max_degree: Number of powers (rows) required.
+        :return: Read-only view of shape (max_degree, N).
+        """
+        if max_degree <= 0:
+            raise ValueError("Degree must be a positive integer.")
+
+        rows = len(self._beta_pow)
+        if rows < max_degree:
+            betas = np.reciprocal(self._primes.astype(np.float64))
+            table = np.empty((max_degree, len(betas)), dtype=np.float64)
+            if rows:
+                table[:rows] = self._beta_pow
+            else:
+                table[0] = betas
+                rows = 1
+            for k in range(rows, max_degree):
+                np.multiply(table[k - 1], betas, out=table[k])
+            table.flags.writeable = False
+            self._beta_pow = table
+
+        return self._beta_pow[:max_degree]
+
+    @staticmethod
+    def _normalize_shape(lam: Sequence[int], mu: Optional[Sequence[int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts lambda/mu to int64 arrays of equal length k = len(lambda),
+        padding mu with zeros (conjugate depth) or using zeros if mu is None.
+        """
+        lam_a = np.asarray(lam, dtype=np.int64)
+        mu_a = np.zeros_like(lam_a)
+        if mu is not None:
+            n = min(len(lam_a), len(mu))
+            mu_a[:n] = mu[:n]
+        return lam_a, mu_a
+
+    @staticmethod
+    def _shape_key(lam: Sequence[int], mu: Optional[Sequence[int]]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Memo key for lambda/mu: plain int tuples normalized like _normalize_shape(),
+        cheap enough to build before any array work so cache hits skip it.
+        """
+        lam_t = tuple(int(x) for x in lam)
+        k = len(lam_t)
+        if mu is None:
+            return lam_t, (0,) * k
+        mu_t = tuple(int(x) for x in mu[:k])
+        return lam_t, mu_t + (0,) * (k - len(mu_t))
+
+    def _construct_jacobi_trudi(self, lam: Sequence[int], mu: Sequence[int]) -> np.ndarray:
         """
         Constructs the Jacobi-Trudi matrix M for the skew shape lambda/mu.
         M_{i,j} = h_{lambda_i - mu_j - i + j}
+        Expects lambda and mu of equal length, as from _shape_key() or _normalize_shape().
         """
         k = len(lam)
-        if len(mu) != k:
-            # Pad mu with zeros if necessary to match lambda length (conjugate depth)
-            mu = mu + [0] * (k - len(mu))
-            
-        matrix = np.zeros((k, k), dtype=np.float64)
-        
-        for i in range(k):
-            for j in range(k):
-                idx = lam[i] - mu[j] - i + j
-                if idx < 0:
-                    matrix[i, j] = 0.0
-                elif idx >= len(self._h_basis):
-                    raise IndexError(f"Basis degree {self._degree} insufficient for partition index {idx}.")
-                else:
-                    matrix[i, j] = self._h_basis[idx]
-                    
+        if k < _GATHER_MIN_K:
+            # Small matrices: the fixed cost of the array gather dominates
+            idx = [l - i - m + j for i, l in enumerate(lam) for j, m in enumerate(mu)]
+            top = max(idx)
+            if top >= len(self._h_basis):
+                raise IndexError(f"Basis degree {self._degree} insufficient for partition index {top}.")
+            h = self._h_list
+            return np.array([h[x + 1] if x >= 0 else 0.0 for x in idx]).reshape(k, k)
+
+        i = np.arange(k)[:, None]
+        j = np.arange(k)[None, :]
+        idx = np.asarray(lam)[:, None] - np.asarray(mu)[None, :] - i + j
+
+        if idx.max() >= len(self._h_basis):
+            raise IndexError(f"Basis degree {self._degree} insufficient for partition index {idx.max()}.")
+
+        # Negative indices all map to the h_padded[0] = 0 slot (h_k = 0 for k < 0).
+        # The basis is held in extended precision; LAPACK needs float64.
+        matrix = self._h_padded[np.maximum(idx + 1, 0)]
         return matrix
 
-    def evaluate_partition(self, lam: List[int], mu: List[int] = None) -> float:
+    @staticmethod
+    def _trivial_shape(lam: Sequence[int], mu: Sequence[int]) -> Optional[Tuple[float, float]]:
+        """
+        Resolves skew shapes whose capacity is known without a determinant, in
+        (sign, log|det|) form: s_{lambda/mu} = 0 if mu is not contained in lambda,
+        and s_{lambda/lambda} = 1. Returns None for any other shape.
+        Expects the normalized tuples of _shape_key().
+        """
+        if any(l < m for l, m in zip(lam, mu)):
+            return 0.0, -np.inf
+        if lam == mu:
+            return 1.0, 0.0
+        return None
+
+    def evaluate_partition(self, lam: Sequence[int], mu: Optional[Sequence[int]] = None) -> float:
         """
         Calculates the Schur Capacity (S) for the constellation defined by lambda/mu.
         
@@ -108,35 +419,369 @@ class SchurSieve:
         :param mu: Partition mu (base shape, defaults to empty/zeros).
         :return: The determinant of the associated Jacobi-Trudi matrix.
         """
-        if mu is None:
-            mu = [0] * len(lam)
-            
+        sign, logdet = self.evaluate_partition_log(lam, mu)
+        return sign * np.exp(logdet)
+
+    def evaluate_partition_log(self, lam: Sequence[int], mu: Optional[Sequence[int]] = None) -> Tuple[float, float]:
+        """
+        Calculates the Schur Capacity for lambda/mu in logarithmic form.
+        Avoids the underflow of the plain determinant for high-degree shapes.
+        Results are memoized per (lambda, mu) until the basis changes.
+        
+        :param lam: Partition lambda (tuple representation of the constellation).
+        :param mu: Partition mu (base shape, defaults to empty/zeros).
+        :return: Tuple (sign, log|det|) of the associated Jacobi-Trudi matrix.
+        """
         if not len(self._h_basis):
             raise RuntimeError("Basis uninitialized. Call compute_basis() first.")
+
+        key = self._shape_key(lam, mu)
+        cached = self._partition_cache.get(key)
+        if cached is not None:
+            return cached
+
+        trivial = self._trivial_shape(*key)
+        if trivial is not None:
+            self._memoize_partition(key, *trivial)
+            return trivial
             
-        matrix = self._construct_jacobi_trudi(lam, mu)
+        matrix = self._construct_jacobi_trudi(*key)
         
         # Determinant calculation (Volume of the non-intersecting path space)
-        det = np.linalg.det(matrix)
-        return det
+        sign, logdet = np.linalg.slogdet(matrix)
+        self._memoize_partition(key, sign, logdet)
+        return sign, logdet
+
+    def _memoize_partition(self, key: Tuple[Tuple[int, ...], Tuple[int, ...]], sign: float, logdet: float) -> None:
+        """
+        Stores (sign, log|det|) for a partition, evicting the oldest entries
+        (dicts keep insertion order) once _PARTITION_CACHE_SIZE is reached.
+        """
+        cache = self._partition_cache
+        while len(cache) >= _PARTITION_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = (sign, logdet)
+
+    def evaluate_partitions(self, configs: Sequence[Tuple[Sequence[int], Optional[Sequence[int]]]],
+                            n_jobs: int = 1) -> List[float]:
+        """
+        Calculates the Schur Capacities for a sweep of (lambda, mu) configurations.
+        Matrices of equal size are stacked and factorized in a single batched
+        slogdet call; with n_jobs != 1 the stacks are split across joblib workers.
+        
+        :param configs: Sequence of (lambda, mu) tuples; mu may be None.
+        :param n_jobs: Number of joblib workers (requires joblib unless 1; negative
+            values count back from the number of CPUs, as in joblib).
+        :return: The capacities, in the order of configs.
+        :raises ValueError: If n_jobs is 0.
+        """
+        if not len(self._h_basis):
+            raise RuntimeError("Basis uninitialized. Call compute_basis() first.")
+        if n_jobs == 0:
+            raise ValueError("n_jobs == 0 has no meaning; use 1 for a serial sweep.")
+        if n_jobs != 1 and Parallel is None:
+            raise ImportError("Parallel sweeps require joblib.")
+
+        results: List[float] = [0.0] * len(configs)
+        # Per matrix size, the distinct pending shapes and the configs that share them
+        pending: Dict[int, Dict[Tuple[Tuple[int, ...], Tuple[int, ...]], List[int]]] = {}
+        for n, (lam, mu) in enumerate(configs):
+            key = self._shape_key(lam, mu)
+            cached = self._partition_cache.get(key)
+            if cached is None:
+                cached = self._trivial_shape(*key)
+                if cached is None:
+                    pending.setdefault(len(key[0]), {}).setdefault(key, []).append(n)
+                    continue
+                self._memoize_partition(key, *cached)
+            results[n] = cached[0] * np.exp(cached[1])
+
+        for group in pending.values():
+            stack = np.stack([self._construct_jacobi_trudi(*key) for key in group])
+            if n_jobs == 1:
+                signs, logdets = np.linalg.slogdet(stack)
+            else:
+                # LAPACK releases the GIL, so threads avoid pickling the sieve
+                n_chunks = min(len(stack), effective_n_jobs(n_jobs) * 4)
+                chunks = np.array_split(stack, n_chunks)
+                parts = Parallel(n_jobs=n_jobs, prefer="threads")(
+                    delayed(np.linalg.slogdet)(chunk) for chunk in chunks)
+                signs = np.concatenate([part[0] for part in parts])
+                logdets = np.concatenate([part[1] for part in parts])
+
+            for (key, indices), sign, logdet in zip(group.items(), signs, logdets):
+                self._memoize_partition(key, sign, logdet)
+                for n in indices:
+                    results[n] = sign * np.exp(logdet)
+
+        return results
+
+    def evaluate_partition_family(self, lams: Sequence[Sequence[int]],
+                                  mu: Optional[Sequence[int]] = None) -> List[float]:
+        """
+        Calculates the Schur Capacities of lambda_1/mu, ..., lambda_m/mu for a family
+        of partitions sharing a leading segment lambda_1..lambda_r and the base mu.
+        
+        The first r rows [A0 B] of the Jacobi-Trudi matrix are then common to the
+        family, so by the Schur complement (Sylvester/Chio condensation)
+        det M = det(A0) * det(D - C A0^{-1} B),
+        where A0^{-1} B is factorized once and each member only needs a
+        (k - r) x (k - r) determinant.
+        
+        With no shared prefix (r = 0), or an A0 that is singular or worse conditioned
+        than _COND_LIMIT, nothing can be condensed and the family is handed to
+        evaluate_partitions() as a plain sweep.
+        
+        :param lams: The partitions lambda of the family (padded with zeros to a common length).
+        :param mu: Partition mu (base shape, defaults to empty/zeros).
+        :return: The capacities, in the order of lams.
+        """
+        if not len(self._h_basis):
+            raise RuntimeError("Basis uninitialized. Call compute_basis() first.")
+        if not len(lams):
+            return []
+
+        k = max(len(lam) for lam in lams)
+        padded = np.zeros((len(lams), k), dtype=np.int64)
+        for n, lam in enumerate(lams):
+            padded[n, :len(lam)] = lam
+        rows = padded.tolist()
+        mu_t = self._shape_key(rows[0], mu)[1]
+
+        # Length r of the leading rows shared by every member
+        shared = (padded == padded[0]).all(axis=0)
+        r = k if shared.all() else int(np.argmin(shared))
+
+        head = self._construct_jacobi_trudi(rows[0], mu_t)
+        a0 = head[:r, :r]
+        sign_0, log_0 = np.linalg.slogdet(a0)
+        if r == 0 or sign_0 == 0 or np.linalg.cond(a0) > _COND_LIMIT:
+            # Nothing shared, or no reliable A0^{-1} B: evaluate members directly
+            return self.evaluate_partitions([(lam, mu_t) for lam in rows])
+        x = np.linalg.solve(a0, head[:r, r:])
+
+        results: List[float] = []
+        for lam in rows:
+            matrix = self._construct_jacobi_trudi(lam, mu_t)
+            schur = matrix[r:, r:] - matrix[r:, :r] @ x
+            sign, logdet = np.linalg.slogdet(schur)
+            results.append(sign_0 * sign * np.exp(log_0 + logdet))
+
+        return results
+
+    def walk_partition(self, lam0: Sequence[int], mu: Optional[Sequence[int]],
+                       moves: Sequence[int]) -> List[float]:
+        """
+        Calculates the Schur Capacities along a walk lambda^(0), lambda^(1), ... where
+        each move increments a single part lambda_i by one.
+        
+        A move changes only row i of the Jacobi-Trudi matrix, M' = M + e_i d^T, so by
+        the matrix determinant lemma det M' = det M * (1 + d^T M^{-1} e_i), and the
+        inverse is carried along with the Sherman-Morrison formula in O(k^2) per move.
+        
+        Rank-1 updates accumulate rounding error, so M is refactored from scratch
+        every _WALK_REFACTOR moves and whenever the updated column of the inverse
+        leaves a residual above _WALK_RESIDUAL. While cond(M) exceeds _COND_LIMIT
+        no inverse is kept and every step is a direct slogdet.
+        
+        :param lam0: Starting partition lambda.
+        :param mu: Partition mu (base shape, fixed along the walk; None for empty).
+        :param moves: Row indices i to increment, in order.
+        :return: The capacities of lambda^(0) and of every partition visited.
+        """
+        if not len(self._h_basis):
+            raise RuntimeError("Basis uninitialized. Call compute_basis() first.")
+        lam_t, mu_t = self._shape_key(lam0, mu)
+        lam_l = list(lam_t) # advanced in place along the walk
+        matrix = self._construct_jacobi_trudi(lam_l, mu_t)
+        sign, logdet, inverse = self._factor_walk(matrix)
+        results: List[float] = [sign * np.exp(logdet)]
+
+        for step, i in enumerate(moves, 1):
+            lam_l[i] += 1
+            updated = self._construct_jacobi_trudi(lam_l, mu_t)
+            delta = updated[i] - matrix[i]
+            matrix = updated
+
+            factor = 1.0 + delta @ inverse[:, i] if inverse is not None else 0.0
+            refactor = abs(factor) < 1e-8 or step % _WALK_REFACTOR == 0
+            if not refactor:
+                row = delta @ inverse
+                inverse -= np.outer(inverse[:, i], row) / factor
+                residual = matrix @ inverse[:, i]
+                residual[i] -= 1.0
+                refactor = np.abs(residual).max() > _WALK_RESIDUAL
+            if refactor:
+                # Singular, ill-conditioned or drifting: refactor from scratch
+                sign, logdet, inverse = self._factor_walk(matrix)
+            else:
+                sign *= np.sign(factor)
+                logdet += np.log(abs(factor))
+            results.append(sign * np.exp(logdet))
+
+        return results
+
+    @staticmethod
+    def _factor_walk(matrix: np.ndarray) -> Tuple[float, float, Optional[np.ndarray]]:
+        """
+        Factorizes a walk matrix from scratch: (sign, log|det|, inverse), where the
+        inverse is None if M is singular or worse conditioned than _COND_LIMIT.
+        """
+        sign, logdet = np.linalg.slogdet(matrix)
+        if sign == 0 or np.linalg.cond(matrix) > _COND_LIMIT:
+            return sign, logdet, None
+        return sign, logdet, np.linalg.inv(matrix)
+
+    def evaluate_bialternant(self, lam: Sequence[int], support_size: Optional[int] = None) -> float:
+        """
+        Calculates the Schur function s_lambda directly from the bialternant formula
+        s_lambda(x_1..x_n) = det(x_i^{lambda_j + n - j}) / det(x_i^{n - j}),
+        with x_i = 1/p_i taken over the n smallest primes.
+        
+        Needs no call to compute_basis(), but it only sees the n selected primes:
+        unless support_size = N, the result is s_lambda restricted to those
+        variables and is smaller than evaluate_partition() over all N primes.
+        The default support_size = len(lambda) is the crudest such truncation.
+        
+        The alternant is ill-conditioned in clustered variables such as 1/p, so
+        the support is usable up to about ten primes; beyond that (condition
+        number above _COND_LIMIT) a ValueError is raised instead of a wrong value.
+        The Vandermonde denominator is evaluated in closed form,
+        prod_{i<j} (x_i - x_j), and the variables are scaled by max x_i
+        (s_lambda is homogeneous of degree |lambda|).
+        
+        :param lam: Partition lambda (straight shapes only).
+        :param support_size: Number n of primes used as variables (defaults to len(lambda)).
+        :return: The value of s_lambda on the selected betas.
+        :raises ValueError: If the support size is out of range or the alternant is
+                            too ill-conditioned for a reliable determinant.
+        """
+        k = len(lam)
+        n = k if support_size is None else support_size
+        if not k <= n <= len(self._primes):
+            raise ValueError(f"Support size must lie in [{k}, {len(self._primes)}].")
+
+        if n < len(self._primes):
+            support = np.partition(self._primes, n - 1)[:n]
+        else:
+            support = self._primes
+        # Ascending primes give decreasing betas, so every x_i - x_j (i < j) is positive
+        betas = np.reciprocal(np.sort(support).astype(np.float64))
+        scaled = betas / betas[0]
+
+        # Exponents lambda_j + n - j for the alternant, n - j for the Vandermonde
+        delta = np.arange(n - 1, -1, -1)
+        lam_a = np.zeros(n, dtype=np.int64)
+        lam_a[:k] = lam
+
+        alternant = np.power.outer(scaled, lam_a + delta)
+        sign_num, log_num = np.linalg.slogdet(alternant)
+        if sign_num <= 0 or not np.isfinite(log_num) or np.linalg.cond(alternant) > _COND_LIMIT:
+            raise ValueError(f"Alternant over {n} primes is too ill-conditioned; reduce support_size.")
+
+        i, j = np.triu_indices(n, 1)
+        log_den = np.log(scaled[i] - scaled[j]).sum()
+        return np.exp(log_num - log_den + lam_a.sum() * np.log(betas[0]))
+
+    def evaluate_partition_koev(self, lam: Sequence[int], mu: Optional[Sequence[int]] = None) -> float:
+        """
+        Calculates the Schur Capacity for lambda/mu without subtractions, following
+        the branching rule of Demmel and Koev:
+        s_{lambda/mu}(x_1..x_n) = sum_nu s_{nu/mu}(x_1..x_{n-1}) x_n^{|lambda/nu|},
+        over the nu such that lambda/nu is a horizontal strip.
+        
+        Every intermediate value is a sum of positive path weights, so there is
+        no cancellation; the cost is O(N * T) for T strip transitions between the
+        partitions nu with mu <= nu <= lambda. Needs no call to compute_basis().
+        
+        This is an accuracy reference rather than a fast path. For N >= 
+        _NJIT_MIN_KOEV_PRIMES the transfer loop runs in a numba kernel when numba
+        is installed; otherwise each prime costs a few NumPy calls (~10 us), i.e.
+        on the order of minutes per partition at N ~ 10^7.
+        
+        :param lam: Partition lambda (tuple representation of the constellation).
+        :param mu: Partition mu (base shape, defaults to empty/zeros).
+        :return: The value of s_{lambda/mu} on betas = 1/p.
+        :raises ValueError: If lambda or mu is not a partition.
+        """
+        lam_a, mu_a = self._normalize_shape(lam, mu)
+        for name, part in (("lambda", lam_a), ("mu", mu_a)):
+            if (part < 0).any() or (np.diff(part) > 0).any():
+                raise ValueError(f"{name} = {part.tolist()} is not a partition.")
+        lam_t, mu_t = tuple(lam_a.tolist()), tuple(mu_a.tolist())
+        trivial = self._trivial_shape(lam_t, mu_t)
+        if trivial is not None:
+            return trivial[0] * np.exp(trivial[1])
+
+        src, dst, deg, index = self._strip_transitions(lam_t, mu_t)
+        n_states = len(index)
+        max_deg = int(deg.max()) if len(deg) else 0
+
+        state = np.zeros(n_states, dtype=np.float64)
+        state[index[mu_t]] = 1.0
+        betas = np.reciprocal(self._primes.astype(np.float64))
+
+        jit = _jit_kernels() if len(betas) >= _NJIT_MIN_KOEV_PRIMES else None
+        if jit is not None:
+            state = jit.strip_transfer(betas, src, dst, deg, state, max_deg)
+        else:
+            # One transfer step per prime: nu gathers rho * x^{|nu/rho|}
+            for x in betas:
+                x_pow = np.power(x, np.arange(max_deg + 1))
+                state = np.bincount(dst, weights=state[src] * x_pow[deg], minlength=n_states)
+
+        return state[index[lam_t]]
+
+    @staticmethod
+    def _strip_transitions(lam: Sequence[int], mu: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[Tuple[int, ...], int]]:
+        """
+        Enumerates the partitions nu with mu <= nu <= lambda and every pair (rho, nu)
+        where nu/rho is a horizontal strip, i.e. nu_{i+1} <= rho_i <= nu_i.
+        Returns flat arrays (src, dst, deg) of state indices and strip sizes,
+        together with the partition -> index map.
+        """
+        k = len(lam)
+        shapes: List[Tuple[int, ...]] = [()]
+        for i in range(k):
+            shapes = [nu + (v,) for nu in shapes
+                      for v in range(mu[i], min(lam[i], nu[-1] if nu else lam[i]) + 1)]
+        index = {nu: n for n, nu in enumerate(shapes)}
+
+        src: List[int] = []
+        dst: List[int] = []
+        deg: List[int] = []
+        for nu in shapes:
+            rhos: List[Tuple[int, ...]] = [()]
+            for i in range(k):
+                lower = max(mu[i], nu[i + 1] if i + 1 < k else 0)
+                rhos = [rho + (v,) for rho in rhos for v in range(lower, nu[i] + 1)]
+            for rho in rhos:
+                src.append(index[rho])
+                dst.append(index[nu])
+                deg.append(sum(nu) - sum(rho))
+
+        return (np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64),
+                np.array(deg, dtype=np.int64), index)
 
-    def compare_topologies(self, config_a: Tuple[List[int], List[int]], 
-                           config_b: Tuple[List[int], List[int]]) -> Dict[str, float]:
+    def compare_topologies(self, config_a: Tuple[Sequence[int], Optional[Sequence[int]]], 
+                           config_b: Tuple[Sequence[int], Optional[Sequence[int]]]) -> Dict[str, float]:
         """
         Computes the relative stability ratio chi between two topological configurations.
+        The ratio is formed from log-determinants, so it stays finite even when
+        both capacities underflow in double precision.
         
         :param config_a: Tuple (lambda, mu) for the reference configuration (denominator).
         :param config_b: Tuple (lambda, mu) for the target configuration (numerator).
         :return: Dictionary containing capacities S_a, S_b and the ratio chi = S_b / S_a.
         """
-        s_a = self.evaluate_partition(*config_a)
-        s_b = self.evaluate_partition(*config_b)
+        sign_a, log_a = self.evaluate_partition_log(*config_a)
+        sign_b, log_b = self.evaluate_partition_log(*config_b)
         
-        if np.isclose(s_a, 0.0):
+        if sign_a == 0:
             raise ValueError("Singular topology: Reference configuration capacity is zero.")
             
         return {
-            "capacity_denominator": s_a,
-            "capacity_numerator": s_b,
-            "chi_ratio": s_b / s_a
+            "capacity_denominator": sign_a * np.exp(log_a),
+            "capacity_numerator": sign_b * np.exp(log_b),
+            "chi_ratio": sign_a * sign_b * np.exp(log_b - log_a)
         }
@@ -1,29 +1,188 @@
 """
 Validation script for SchurSieve.
 Generates a local prime sequence and verifies the Jacobi-Trudi 
-determinant for twin and sexy prime configurations.
+determinant for twin and sexy prime configurations, then cross-checks
+the batched, condensed and alternative evaluators against it.
 """
 
 import os
+from contextlib import contextmanager
+from math import log
+
+import numpy as np
+import schur_sieve
 from schur_sieve import SchurSieve
 
+# Primes in the bialternant cross-check (the alternant degrades past about ten)
+SMALL_SUPPORT = 8
+
 def generate_sample_primes(n=1000):
     """Generates the first n primes to a temporary file for testing."""
-    primes = []
-    chk = 2
-    while len(primes) < n:
-        for d in range(2, int(chk**0.5) + 1):
-            if chk % d == 0:
-                break
-        else:
-            primes.append(chk)
-        chk += 1
+    # Sieve of Eratosthenes up to the bound p_n < n(ln n + ln ln n), n >= 6
+    upper = 15 if n < 6 else int(n * (log(n) + log(log(n)))) + 1
+    sieve = np.ones(upper + 1, dtype=bool)
+    sieve[:2] = False
+    for i in range(2, int(upper**0.5) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = False
+    primes = np.flatnonzero(sieve)[:n]
     
-    with open("primes_sample.txt", "w") as f:
-        for p in primes:
-            f.write(f"{p}\n")
+    np.savetxt("primes_sample.txt", primes, fmt="%d")
     return "primes_sample.txt"
 
+def check(name, got, expected, rtol=1e-8):
+    """Prints the outcome of one cross-check; returns its name if it failed."""
+    ok = np.allclose(got, expected, rtol=rtol, atol=1e-300)
+    print(f"[TEST] {name}: {'ok' if ok else 'MISMATCH'}")
+    return None if ok else name
+
+@contextmanager
+def jit_thresholds(**values):
+    """
+    Temporarily overrides schur_sieve JIT thresholds, e.g. _NJIT_MIN_DEGREE=0.
+    The process-wide basis caches are emptied on entry and exit, so that neither
+    path is served results computed by the other.
+    """
+    saved = {name: getattr(schur_sieve, name) for name in values}
+    for name, value in values.items():
+        setattr(schur_sieve, name, value)
+    schur_sieve._H_BASIS_CACHE.clear()
+    schur_sieve._P_SUMS_CACHE.clear()
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(schur_sieve, name, value)
+        schur_sieve._H_BASIS_CACHE.clear()
+        schur_sieve._P_SUMS_CACHE.clear()
+
+def numba_missing(name):
+    """Reports a JIT cross-check as skipped when numba is not installed."""
+    if schur_sieve._jit_kernels() is None:
+        print(f"[TEST] {name}: skipped (numba not installed)")
+        return True
+    return False
+
+def check_sweep(sieve, reference):
+    """evaluate_partitions over a sweep with repeats, trivial shapes and a mu longer than lambda."""
+    configs = [([a, b, 1], [2, 1, 0]) for a in range(2, 9) for b in range(1, a + 1)]
+    configs += [([4, 4, 1], [2, 1]), ([3, 1], [3, 1]), ([2, 2], [3]), ([2, 1], [1, 0, 0])]
+    return check("evaluate_partitions", sieve.evaluate_partitions(configs),
+                 [reference.evaluate_partition(lam, mu) for lam, mu in configs])
+
+def check_family(sieve, reference):
+    """evaluate_partition_family, condensed (shared prefix) and as a plain sweep (none shared)."""
+    # Given at their common length: a bare [5] would be zero-padded to [5, 0] against mu = [2, 1]
+    families = [[[6, 5, 3, 1], [6, 5, 2, 2], [6, 5, 4, 0]], [[4, 2], [3, 3], [5, 0]]]
+    return check("evaluate_partition_family",
+                 [v for lams in families for v in sieve.evaluate_partition_family(lams, [2, 1])],
+                 [reference.evaluate_partition(lam, [2, 1]) for lams in families for lam in lams])
+
+def check_walk(sieve, reference):
+    """walk_partition along a short walk and an 80-move walk into ill-conditioned shapes."""
+    sieve.compute_basis(max_degree=30)
+    reference.compute_basis(max_degree=30)
+    walks = [([4, 4, 1], [2, 1], [0, 2, 1, 0, 2]), ([3, 2, 2, 1, 1], None, [n % 5 for n in range(80)])]
+    got, expected = [], []
+    for lam, mu, moves in walks:
+        got += sieve.walk_partition(lam, mu, moves)
+        lam = list(lam)
+        expected.append(reference.evaluate_partition(lam, mu))
+        for i in moves:
+            lam[i] += 1
+            expected.append(reference.evaluate_partition(lam, mu))
+    return check("walk_partition", got, expected)
+
+# Koev shapes, including a padded mu and a trivial shape
+KOEV_SHAPES = [([4, 4, 1], [2, 1, 0]), ([8, 8, 1], [2, 1]), ([3], None), ([2, 1], [1, 0, 0]), ([3, 1], [3, 1])]
+
+def check_koev(sieve, reference):
+    """evaluate_partition_koev (NumPy transfer loop) against Jacobi-Trudi."""
+    return check("evaluate_partition_koev",
+                 [sieve.evaluate_partition_koev(lam, mu) for lam, mu in KOEV_SHAPES],
+                 [reference.evaluate_partition(lam, mu) for lam, mu in KOEV_SHAPES])
+
+def check_koev_jit(sieve):
+    """The strip_transfer kernel against the NumPy transfer loop."""
+    name = "evaluate_partition_koev (JIT)"
+    if numba_missing(name):
+        return None
+    expected = [sieve.evaluate_partition_koev(lam, mu) for lam, mu in KOEV_SHAPES]
+    with jit_thresholds(_NJIT_MIN_KOEV_PRIMES=0):
+        got = [sieve.evaluate_partition_koev(lam, mu) for lam, mu in KOEV_SHAPES]
+    return check(name, got, expected, rtol=1e-12)
+
+def check_newton_jit(filename):
+    """The newton_h kernel against the long double recurrence, through h_k = s_(k)."""
+    name = "compute_basis (JIT)"
+    if numba_missing(name):
+        return None
+    degrees = range(1, 41)
+    with jit_thresholds(_NJIT_MIN_DEGREE=10):
+        fast = SchurSieve(data_source=filename, n_limit=5000)
+        fast.compute_basis(max_degree=40)
+        got = [fast.evaluate_partition([k]) for k in degrees]
+    exact = SchurSieve(data_source=filename, n_limit=5000)
+    exact.compute_basis(max_degree=40)
+    return check(name, got, [exact.evaluate_partition([k]) for k in degrees], rtol=1e-12)
+
+def check_power_sums_jit(filename):
+    """The accumulate_power_sums kernel against the long double power sums, through h_k."""
+    name = "power sums (JIT)"
+    if numba_missing(name):
+        return None
+    degrees = range(1, 21)
+    with jit_thresholds(_NJIT_MIN_PRIMES=0):
+        fast = SchurSieve(data_source=filename, n_limit=5000)
+        fast.compute_basis(max_degree=20)
+        got = [fast.evaluate_partition([k]) for k in degrees]
+    exact = SchurSieve(data_source=filename, n_limit=5000)
+    exact.compute_basis(max_degree=20)
+    return check(name, got, [exact.evaluate_partition([k]) for k in degrees], rtol=1e-12)
+
+def check_bialternant(filename):
+    """evaluate_bialternant at full support, on a sieve over the first SMALL_SUPPORT primes."""
+    small = SchurSieve(data_source=filename, n_limit=SMALL_SUPPORT)
+    small.compute_basis(max_degree=10)
+    straight = [[2], [2, 1], [3, 1, 1], [2, 2]]
+    return check("evaluate_bialternant (full support)",
+                 [small.evaluate_bialternant(lam, support_size=SMALL_SUPPORT) for lam in straight],
+                 [small.evaluate_partition(lam) for lam in straight], rtol=1e-6)
+
+def check_csv_row():
+    """A one-row CSV loads as one prime: s_(1) on {1/7} is 1/7."""
+    path = "primes_row.csv"
+    with open(path, "w") as fh:
+        fh.write("7,1\n")
+    try:
+        row = SchurSieve(data_source=path, n_limit=10)
+        return check("one-row CSV (evaluate_partition_koev)", row.evaluate_partition_koev([1]), 1 / 7)
+    finally:
+        os.remove(path)
+
+def cross_check(filename, sieve):
+    """
+    Compares the alternative evaluators of `sieve` with evaluate_partition() on a
+    fresh sieve over the same primes, so that no memoized value is reused, and
+    the JIT kernels with their NumPy counterparts.
+    Returns the names of the checks that disagree.
+    """
+    reference = SchurSieve(data_source=filename, n_limit=5000)
+    reference.compute_basis(max_degree=20)
+
+    failures = [
+        check_sweep(sieve, reference),
+        check_bialternant(filename),
+        check_family(sieve, reference),
+        check_walk(sieve, reference),
+        check_koev(sieve, reference),
+        check_koev_jit(sieve),
+        check_csv_row(),
+        check_newton_jit(filename),
+        check_power_sums_jit(filename),
+    ]
+    return [name for name in failures if name]
+
 def run_test():
     print("--- Starting SchurSieve Integrity Test ---")
     
@@ -59,6 +218,14 @@ def run_test():
             print("\n[SUCCESS] Test passed: Twin topology shows higher structural stability.")
         else:
             print("\n[WARNING] Unexpected ratio. Check prime density and partition indices.")
+
+        # 7. Cross-check the alternative evaluators
+        print("\n--- Consistency Checks ---")
+        failures = cross_check(filename, sieve)
+        if failures:
+            print(f"\n[WARNING] Cross-checks failed: {', '.join(failures)}")
+        else:
+            print("\n[SUCCESS] All cross-checks passed.")
             
     except Exception as e:
         print(f"\n[ERROR] Test failed: {e}")